@@ -0,0 +1,371 @@
+import argparse
+import asyncio
+import json
+import logging
+import random
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# assess/drone/validate use top-level imports (see setup.py); make them resolvable
+# when this module runs as ``python -m Desafio_Bonus.api``
+BASE_DIR = Path(__file__).parent
+if str(BASE_DIR) not in sys.path:
+    sys.path.insert(0, str(BASE_DIR))
+
+from .main import DATA_FILE, load_and_catalog
+from .assess import assess_capture
+from .drone import DroneController
+
+
+# lines per chunk when streaming NDJSON
+BATCH_LINES = 1000
+MAX_BODY_BYTES = 16 * 1024 * 1024
+# cached NDJSON responses are evicted least-recently-used past either bound
+MAX_CACHE_ENTRIES = 64
+MAX_CACHE_BYTES = 256 * 1024 * 1024
+
+log = logging.getLogger(__name__)
+
+REASONS = {
+    200: "OK",
+    304: "Not Modified",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+    501: "Not Implemented",
+}
+
+
+@dataclass
+class Response:
+    status: int = 200
+    headers: Dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+    # set for NDJSON results; sent with chunked transfer encoding
+    chunks: Optional[Iterable[bytes]] = None
+
+    def json(self) -> Any:
+        return json.loads(self.body)
+
+    def lines(self) -> List[Any]:
+        data = b"".join(self.chunks) if self.chunks is not None else self.body
+        return [json.loads(line) for line in data.splitlines() if line]
+
+
+class ApiError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def _json_response(payload: Any, status: int = 200) -> Response:
+    return Response(status=status, headers={"Content-Type": "application/json"}, body=json.dumps(payload).encode("utf-8"))
+
+
+def _duck_dict(d) -> Dict[str, Any]:
+    return dict(
+        d.__dict__,
+        drone=d.drone.__dict__,
+        location=d.location.__dict__,
+        superpower=d.superpower.__dict__ if d.superpower else None,
+    )
+
+
+def _ndjson(rows: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+    dumps = json.JSONEncoder(ensure_ascii=False).encode
+    batch = []
+    for row in rows:
+        batch.append(dumps(row))
+        if len(batch) >= BATCH_LINES:
+            batch.append("")
+            yield "\n".join(batch).encode("utf-8")
+            batch = []
+    if batch:
+        batch.append("")
+        yield "\n".join(batch).encode("utf-8")
+
+
+class CatalogService:
+    """Catalog, assessment and planning endpoints over an in-memory catalog.
+
+    Cacheable responses are stored per catalog version, so replacing the
+    catalog invalidates them all at once. ``dispatch`` is the whole request
+    handler and can be called directly in tests without opening a socket.
+    """
+
+    def __init__(self, ducks=None):
+        self.version = 0
+        self.ducks = []
+        self.by_id = {}
+        self._cache: "OrderedDict[Tuple, List[bytes]]" = OrderedDict()
+        self._cache_bytes = 0
+        # dispatch and streaming run on executor threads
+        self._lock = threading.Lock()
+        if ducks is not None:
+            self.replace(ducks)
+
+    def load(self, path: Path):
+        quarantine = []
+        self.replace(load_and_catalog(path, quarantine))
+        return quarantine
+
+    def replace(self, ducks):
+        self.ducks = list(ducks)
+        self.by_id = {d.id: d for d in self.ducks}
+        with self._lock:
+            self.version += 1
+            self._cache.clear()
+            self._cache_bytes = 0
+
+    @property
+    def etag(self) -> str:
+        return f'"catalog-{self.version}"'
+
+    def dispatch(self, method: str, path: str, body: bytes = b"", headers: Optional[Dict[str, str]] = None) -> Response:
+        headers = headers or {}
+        route = path.split("?", 1)[0].rstrip("/") or "/"
+        try:
+            handler = self._routes().get(route)
+            if handler is None:
+                raise ApiError(404, f"unknown path: {route}")
+            allowed, fn = handler
+            if method != allowed:
+                raise ApiError(405, f"{route} expects {allowed}")
+            if method == "GET" and headers.get("if-none-match") == self.etag:
+                return Response(status=304, headers={"ETag": self.etag})
+            response = fn(self._parse(body) if method == "POST" else {})
+        except ApiError as e:
+            return _json_response({"error": str(e)}, e.status)
+        except Exception:
+            log.exception("error handling %s %s", method, route)
+            return _json_response({"error": "internal error"}, 500)
+        response.headers.setdefault("ETag", self.etag)
+        return response
+
+    def _routes(self):
+        return {
+            "/health": ("GET", self._health),
+            "/ducks": ("GET", self._ducks),
+            "/assess": ("POST", self._assess),
+            "/plan": ("POST", self._plan),
+        }
+
+    @staticmethod
+    def _parse(body: bytes) -> Dict[str, Any]:
+        if not body:
+            return {}
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            raise ApiError(400, "body must be JSON") from None
+        if not isinstance(payload, dict):
+            raise ApiError(400, "body must be a JSON object")
+        return payload
+
+    def _select(self, payload: Dict[str, Any]):
+        ids = payload.get("ids")
+        if ids is None:
+            return self.ducks, None
+        if not isinstance(ids, list) or not all(isinstance(i, str) for i in ids):
+            raise ApiError(400, "ids must be a list of strings")
+        missing = [i for i in ids if i not in self.by_id]
+        if missing:
+            raise ApiError(404, f"unknown duck ids: {missing[:10]}")
+        return [self.by_id[i] for i in ids], tuple(ids)
+
+    def _stream(self, key: Optional[Tuple], rows: Iterable[Dict[str, Any]]) -> Response:
+        headers = {"Content-Type": "application/x-ndjson"}
+        if key is None:
+            return Response(headers=headers, chunks=_ndjson(rows))
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+        if cached is not None:
+            return Response(headers=headers, chunks=cached)
+        return Response(headers=headers, chunks=self._record(key, _ndjson(rows)))
+
+    def _record(self, key: Tuple, chunks: Iterator[bytes]) -> Iterator[bytes]:
+        # stream the first response while keeping its chunks for the next one
+        version = self.version
+        kept = []
+        size = 0
+        for chunk in chunks:
+            if kept is not None:
+                kept.append(chunk)
+                size += len(chunk)
+                if size > MAX_CACHE_BYTES:
+                    # too big to ever be cached; stop holding a copy
+                    kept = None
+            yield chunk
+        if kept is not None:
+            with self._lock:
+                if version == self.version and key not in self._cache:
+                    self._store(key, kept, size)
+
+    def _store(self, key: Tuple, chunks: List[bytes], size: int):
+        # caller holds self._lock
+        self._cache[key] = chunks
+        self._cache_bytes += size
+        while len(self._cache) > MAX_CACHE_ENTRIES or self._cache_bytes > MAX_CACHE_BYTES:
+            _, evicted = self._cache.popitem(last=False)
+            self._cache_bytes -= sum(len(c) for c in evicted)
+
+    def _health(self, payload) -> Response:
+        return _json_response({"status": "ok", "version": self.version, "ducks": len(self.ducks)})
+
+    def _ducks(self, payload) -> Response:
+        return self._stream((self.version, "ducks"), (_duck_dict(d) for d in self.ducks))
+
+    def _assess(self, payload) -> Response:
+        ducks, ids = self._select(payload)
+        try:
+            base_lat = float(payload.get("base_lat", 0.0))
+            base_lon = float(payload.get("base_lon", 0.0))
+        except (TypeError, ValueError):
+            raise ApiError(400, "base_lat/base_lon must be numbers") from None
+        rows = (assess_capture(d, base_lat, base_lon).__dict__ for d in ducks)
+        # assess_capture does not use the base position yet, so it stays out of the key
+        return self._stream((self.version, "assess", ids), rows)
+
+    def _plan(self, payload) -> Response:
+        ducks, ids = self._select(payload)
+        seed = payload.get("seed")
+        if seed is not None and (isinstance(seed, bool) or not isinstance(seed, (int, str))):
+            raise ApiError(400, "seed must be an integer or a string")
+        # plans include random weaknesses; only seeded plans are reproducible enough to cache
+        rng = random.Random(seed) if seed is not None else None
+        key = (self.version, "plan", ids, seed) if seed is not None else None
+        plans = DroneController(id="control-api").plan_catalog(ducks, rng=rng)
+        return self._stream(key, ({"id": i, "plan": p} for i, p in plans.items()))
+
+
+def _next_chunk(chunks: Iterator[bytes]) -> Optional[bytes]:
+    return next(chunks, None)
+
+
+async def _write_response(writer: asyncio.StreamWriter, response: Response, keep_alive: bool, chunked: bool = True):
+    """Send ``response``; NDJSON chunks use chunked encoding unless ``chunked`` is
+    False (HTTP/1.0), in which case they go out raw and the connection is closed.
+    """
+    if response.chunks is not None and not chunked:
+        keep_alive = False
+    head = [f"HTTP/1.1 {response.status} {REASONS.get(response.status, '')}"]
+    for name, value in response.headers.items():
+        head.append(f"{name}: {value}")
+    head.append("Connection: keep-alive" if keep_alive else "Connection: close")
+    if response.chunks is None:
+        head.append(f"Content-Length: {len(response.body)}")
+        writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + response.body)
+        await writer.drain()
+        return keep_alive
+
+    if chunked:
+        head.append("Transfer-Encoding: chunked")
+    writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1"))
+    chunks = iter(response.chunks)
+    # cached responses are already encoded; fresh ones assess/encode a batch per
+    # chunk, which is CPU work that must stay off the event loop
+    offload = not isinstance(response.chunks, list)
+    loop = asyncio.get_running_loop()
+    while True:
+        chunk = await loop.run_in_executor(None, _next_chunk, chunks) if offload else next(chunks, None)
+        if chunk is None:
+            break
+        writer.write(b"%x\r\n%s\r\n" % (len(chunk), chunk) if chunked else chunk)
+        await writer.drain()
+    if chunked:
+        writer.write(b"0\r\n\r\n")
+    await writer.drain()
+    return keep_alive
+
+
+async def handle_connection(service: CatalogService, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    """Serve requests on one connection until the client closes it (HTTP/1.1 keep-alive)."""
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            try:
+                raw = await reader.readuntil(b"\r\n\r\n")
+            except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                return
+            lines = raw.decode("latin-1").split("\r\n")
+            try:
+                method, path, version = lines[0].split(" ", 2)
+            except ValueError:
+                await _write_response(writer, _json_response({"error": "malformed request line"}, 400), False)
+                return
+            headers = {}
+            for line in lines[1:]:
+                if ":" in line:
+                    name, value = line.split(":", 1)
+                    headers[name.strip().lower()] = value.strip()
+            http11 = version == "HTTP/1.1"
+            connection = headers.get("connection", "").lower()
+            keep_alive = connection != "close" if http11 else connection == "keep-alive"
+
+            if "transfer-encoding" in headers:
+                # request bodies are only framed by Content-Length; reading a chunked
+                # body as empty would desync the connection, so refuse it outright
+                await _write_response(writer, _json_response({"error": "Transfer-Encoding is not supported; send Content-Length"}, 501), False)
+                return
+            raw_length = headers.get("content-length", "0") or "0"
+            if not (raw_length.isascii() and raw_length.isdigit()):
+                await _write_response(writer, _json_response({"error": "invalid Content-Length"}, 400), False)
+                return
+            length = int(raw_length)
+            if length > MAX_BODY_BYTES:
+                await _write_response(writer, _json_response({"error": "body too large"}, 413), False)
+                return
+            if length and headers.get("expect", "").lower() == "100-continue":
+                writer.write(b"HTTP/1.1 100 Continue\r\n\r\n")
+                await writer.drain()
+            body = await reader.readexactly(length) if length else b""
+
+            # catalog-wide work (planning, validation of ids) runs off the event loop too
+            response = await loop.run_in_executor(None, service.dispatch, method, path, body, headers)
+            if not await _write_response(writer, response, keep_alive, chunked=http11):
+                return
+    except (asyncio.IncompleteReadError, ConnectionError):
+        return
+    except Exception:
+        # dispatch answers its own errors with a 500; this covers failures while
+        # streaming, where the status line is already out and dropping the
+        # connection mid-chunk is the only way to signal it
+        log.exception("error serving connection")
+        return
+    finally:
+        writer.close()
+
+
+async def start_server(service: CatalogService, host: str = "127.0.0.1", port: int = 8080) -> asyncio.AbstractServer:
+    return await asyncio.start_server(lambda r, w: handle_connection(service, r, w), host, port)
+
+
+async def serve(service: CatalogService, host: str, port: int):
+    server = await start_server(service, host, port)
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTTP API for the Primordial Ducks catalog")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--data", type=Path, default=DATA_FILE)
+    args = parser.parse_args()
+
+    service = CatalogService()
+    quarantine = service.load(args.data)
+    print(f"Loaded {len(service.ducks)} ducks ({len(quarantine)} quarantined); listening on {args.host}:{args.port}")
+    asyncio.run(serve(service, args.host, args.port))
+
+
+if __name__ == "__main__":
+    main()
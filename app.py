@@ -1,5 +1,5 @@
-import json
-import tempfile
+import hashlib
+import time
 from pathlib import Path
 import importlib.util
 import importlib
@@ -20,49 +20,30 @@ def load_module_from_path(path: Path, name: str):
 BASE_DIR = Path(__file__).parent
 
 
-def load_ducks_from_path(path: Path):
+def load_ducks_from_path(path: Path, quarantine=None):
     # Import modules directly from the current directory
-    models_mod = load_module_from_path(BASE_DIR / "models.py", "models")
-    utils_mod = load_module_from_path(BASE_DIR / "utils.py", "utils")
+    validate_mod = load_module_from_path(BASE_DIR / "validate.py", "validate")
 
-    raw = json.loads(path.read_text())
-    ducks = []
-    for item in raw:
-        d = item["drone"]
-        drone = models_mod.DroneInfo(serial=d["serial"], brand=d.get("brand", ""), manufacturer=d.get("manufacturer", ""), country=d.get("country", ""))
-
-        h_val, h_unit = utils_mod.parse_measurement(item["height"])
-        height_cm = utils_mod.to_cm(h_val, h_unit)
-
-        w_val, w_unit = utils_mod.parse_measurement(item["weight"])
-        weight_g = utils_mod.to_grams(w_val, w_unit)
-
-        loc = item.get("location", {})
-        ref = utils_mod.lookup_reference(loc.get("latitude", 0.0), loc.get("longitude", 0.0))
-        location = models_mod.Location(city=loc.get("city", ""), country=loc.get("country", ""), latitude=loc.get("latitude", 0.0), longitude=loc.get("longitude", 0.0), reference_point=ref)
-
-        p_val, p_unit = utils_mod.parse_measurement(item.get("gps_precision", "0 m"))
-        gps_precision_m = utils_mod.precision_to_meters(p_val, p_unit)
-
-        sp = None
-        if item.get("superpower"):
-            spj = item["superpower"]
-            sp = models_mod.SuperPower(name=spj["name"], description=spj["description"], classification=spj["classification"])
-
-        duck = models_mod.PrimordialDuck(
-            id=item["id"],
-            drone=drone,
-            height_cm=height_cm,
-            weight_g=weight_g,
-            location=location,
-            gps_precision_m=gps_precision_m,
-            status=item.get("status", "hibernacao profunda"),
-            heart_bpm=item.get("heart_bpm"),
-            mutations=item.get("mutations", 0),
-            superpower=sp,
-        )
-        ducks.append(duck)
-    return ducks
+    if quarantine is None:
+        quarantine = []
+    numbered = validate_mod.iter_numbered_records(path.read_text(encoding="utf-8"))
+    return list(validate_mod.iter_valid_ducks(numbered, quarantine))
+
+
+def show_quarantine(quarantine):
+    if not quarantine:
+        return
+    st.warning(f"{len(quarantine)} registro(s) inválido(s) em quarentena; os demais foram carregados.")
+    with st.expander("Relatório de quarentena"):
+        # large uploads can quarantine many rows; the table only shows the first ones
+        st.table([{"linha": q.line, "motivo": q.reason} for q in quarantine[:1000]])
+
+
+def discard_ingest_job():
+    # stop a running upload job and release the upload it holds
+    job = st.session_state.pop("ingest_job", None)
+    if job is not None:
+        job.cancel()
 
 
 def main():
@@ -74,29 +55,50 @@ def main():
     data_choice = st.sidebar.radio("Fonte de dados:", ["sample_data.json", "Upload JSON"])
 
     ducks = []
+    quarantine = []
     data_path = BASE_DIR / "sample_data.json"
 
     if data_choice == "sample_data.json":
+        discard_ingest_job()
         try:
-            ducks = load_ducks_from_path(data_path)
+            ducks = load_ducks_from_path(data_path, quarantine)
         except Exception as e:
             st.error(f"Erro ao carregar dados de exemplo: {e}")
             st.stop()
     else:
-        uploaded = st.sidebar.file_uploader("Envie um arquivo JSON com o formato do desafio", type=["json"])
+        uploaded = st.sidebar.file_uploader("Envie um arquivo JSON ou NDJSON (opcionalmente .gz) com o formato do desafio", type=["json", "ndjson", "gz"])
         if uploaded is not None:
-            try:
-                # write to temp file then reuse existing loader
-                with tempfile.NamedTemporaryFile("w", delete=False, suffix=".json", encoding="utf-8") as tf:
-                    tf.write(uploaded.read().decode("utf-8"))
-                    temp_path = Path(tf.name)
-                ducks = load_ducks_from_path(temp_path)
-            except Exception as e:
-                st.error(f"Erro ao processar upload: {e}")
-                st.stop()
+            ingest_mod = load_module_from_path(BASE_DIR / "ingest.py", "ingest")
+            # file_id changes on every upload; older Streamlit versions lack it, so hash the buffer there
+            key = getattr(uploaded, "file_id", None) or hashlib.sha1(uploaded.getbuffer()).hexdigest()
+            job = st.session_state.get("ingest_job")
+            if job is None or job.key != key:
+                discard_ingest_job()
+                # parse straight from the upload buffer on a worker thread; nothing is written to disk
+                job = ingest_mod.IngestJob(uploaded, key=key).start()
+                st.session_state.ingest_job = job
+
+            ducks = list(job.ducks)
+            quarantine = list(job.quarantine)
+            if job.error:
+                st.error(f"Erro ao processar upload: {job.error}")
+                if not ducks:
+                    st.stop()
+            if not job.done:
+                st.sidebar.progress(int(min(1.0, job.progress) * 100))
+                st.info(f"Processando upload: {len(ducks)} patos válidos e {len(quarantine)} em quarentena até agora.")
+                if ducks:
+                    st.table([{"id": d.id, "status": d.status, "cidade": d.location.city} for d in ducks[-10:]])
+                show_quarantine(quarantine)
+                time.sleep(0.5)
+                rerun = getattr(st, "rerun", None) or st.experimental_rerun
+                rerun()
         else:
+            discard_ingest_job()
             st.info("Envie um arquivo JSON ou selecione o dataset de exemplo.")
 
+    show_quarantine(quarantine)
+
     if not ducks:
         st.warning("Nenhum pato carregado.")
         return
@@ -1,8 +1,88 @@
 import random
-from typing import List, Optional
+import sys
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional
 from models import PrimordialDuck, CaptureAssessment, SuperPower
 
 
+# weakness flags, in the order identify_weakness reports them
+SLOW_MOBILITY = 1 << 0
+TOP_ATTACK_VULNERABLE = 1 << 1
+REQUIRES_HEAVY_ARMOR = 1 << 2
+UNKNOWN_COUNTERMEASURES = 1 << 3
+CHOCOLATE_ATTRACTION = 1 << 4
+SONIC_DISRUPTION = 1 << 5
+SLIPPERY_SLOPE = 1 << 6
+# not a weakness: only selects the closing line of the plan
+LARGE_TARGET = 1 << 7
+
+WEAKNESS_NAMES = (
+    (SLOW_MOBILITY, "slow_mobility"),
+    (TOP_ATTACK_VULNERABLE, "top_attack_vulnerable"),
+    (REQUIRES_HEAVY_ARMOR, "requires_heavy_armor"),
+    (UNKNOWN_COUNTERMEASURES, "unknown_countermeasures"),
+    (CHOCOLATE_ATTRACTION, "chocolate_attraction"),
+    (SONIC_DISRUPTION, "sonic_disruption"),
+    (SLIPPERY_SLOPE, "slippery_slope"),
+)
+RANDOM_WEAKNESSES = [CHOCOLATE_ATTRACTION, SONIC_DISRUPTION, SLIPPERY_SLOPE]
+
+
+@lru_cache(maxsize=1024)
+def classification_mask(classification: str) -> int:
+    # classifications repeat across a catalog, so most are lowercased and scanned once;
+    # the cache is bounded because uploads can carry arbitrary strings
+    sp = classification.lower()
+    mask = 0
+    if "bélico" in sp or "belico" in sp or "alto" in sp:
+        mask |= REQUIRES_HEAVY_ARMOR
+    if "raro" in sp:
+        mask |= UNKNOWN_COUNTERMEASURES
+    return mask
+
+
+def weakness_mask(duck: PrimordialDuck, rng=random) -> int:
+    mask = 0
+    # heuristic weaknesses
+    if duck.weight_g > 50000:
+        mask |= SLOW_MOBILITY
+    if duck.height_cm > 200:
+        mask |= TOP_ATTACK_VULNERABLE
+    if duck.superpower:
+        mask |= classification_mask(duck.superpower.classification)
+    # random chance
+    if rng.random() < 0.2:
+        mask |= rng.choice(RANDOM_WEAKNESSES)
+    if duck.height_cm > 100:
+        mask |= LARGE_TARGET
+    return mask
+
+
+def weakness_names(mask: int) -> List[str]:
+    return [name for bit, name in WEAKNESS_NAMES if mask & bit]
+
+
+# 8 flag bits -> at most 256 distinct plans
+@lru_cache(maxsize=256)
+def plan_for_mask(mask: int) -> str:
+    """Plan text for a weakness bitmask; built once per distinct mask and interned."""
+    plan = []
+    if mask & TOP_ATTACK_VULNERABLE:
+        plan.append("Drop heavy payload from altitude > 50m")
+    if mask & SLOW_MOBILITY:
+        plan.append("Encircle and restrain using nets")
+    if mask & REQUIRES_HEAVY_ARMOR:
+        plan.append("Deploy armored support units")
+    if mask & CHOCOLATE_ATTRACTION:
+        plan.append("Use chocolate as bait (deploy cake-laden volunteers)")
+    if not plan:
+        plan.append("Standard capture routine: stun darts then net")
+    # resource check
+    if mask & LARGE_TARGET:
+        plan.append("Preferred approach: aerial strike + containment")
+    return sys.intern("; ".join(plan))
+
+
 class DroneController:
     def __init__(self, id: str, battery_pct: float = 100.0, fuel_l: float = 10.0, integrity_pct: float = 100.0):
         self.id = id
@@ -24,41 +104,24 @@ class DroneController:
         return {"battery": self.battery, "fuel": self.fuel, "integrity": self.integrity}
 
     def identify_weakness(self, duck: PrimordialDuck) -> List[str]:
-        weaknesses = []
-        # heuristic weaknesses
-        if duck.weight_g > 50000:
-            weaknesses.append("slow_mobility")
-        if duck.height_cm > 200:
-            weaknesses.append("top_attack_vulnerable")
-        if duck.superpower:
-            sp = duck.superpower.classification.lower()
-            if "bélico" in sp or "belico" in sp or "alto" in sp:
-                weaknesses.append("requires_heavy_armor")
-            if "raro" in sp:
-                weaknesses.append("unknown_countermeasures")
-        # random chance
-        if random.random() < 0.2:
-            weaknesses.append(random.choice(["chocolate_attraction", "sonic_disruption", "slippery_slope"]))
-        return weaknesses
+        return weakness_names(weakness_mask(duck))
 
     def plan_attack(self, duck: PrimordialDuck) -> str:
-        weaknesses = self.identify_weakness(duck)
-        plan = []
-        if "top_attack_vulnerable" in weaknesses:
-            plan.append("Drop heavy payload from altitude > 50m")
-        if "slow_mobility" in weaknesses:
-            plan.append("Encircle and restrain using nets")
-        if "requires_heavy_armor" in weaknesses:
-            plan.append("Deploy armored support units")
-        if "chocolate_attraction" in weaknesses:
-            plan.append("Use chocolate as bait (deploy cake-laden volunteers)")
-        if not plan:
-            plan.append("Standard capture routine: stun darts then net")
-        # resource check
-        if duck.height_cm > 100:
-            plan.append("Preferred approach: aerial strike + containment")
+        plan = plan_for_mask(weakness_mask(duck))
         self.history.append(f"Planned attack for {duck.id}: {plan}")
-        return "; ".join(plan)
+        return plan
+
+    def plan_catalog(self, ducks: Iterable[PrimordialDuck], rng=None) -> Dict[str, str]:
+        """Plan every duck in one pass, returning {duck id: plan}.
+
+        Ducks sharing a weakness mask share the same (cached) plan string, so the
+        cost is one mask and one cache lookup per duck; history gets a single
+        summary entry instead of one per duck.
+        """
+        rng = rng or random
+        result = {duck.id: plan_for_mask(weakness_mask(duck, rng)) for duck in ducks}
+        self.history.append(f"Planned attacks for {len(result)} ducks")
+        return result
 
     def random_defense(self, weakness_tag: Optional[str] = None) -> str:
         # emulates the bizarre defenses described in prompt
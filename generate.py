@@ -0,0 +1,153 @@
+import argparse
+import gzip
+import json
+import random
+import sys
+from bisect import bisect
+from itertools import accumulate
+from typing import Any, Dict, IO, Iterator
+
+
+# (city, country, latitude, longitude); ducks cluster around these points
+CLUSTERS = [
+    ("Manaus", "Brazil", -3.1019, -60.025),
+    ("Rio de Janeiro", "Brazil", -22.95, -43.17),
+    ("Inverness", "UK", 57.4778, -4.2247),
+    ("Anchorage", "USA", 61.2181, -149.9003),
+    ("Reykjavik", "Iceland", 64.1466, -21.9426),
+    ("Kyoto", "Japan", 35.0116, 135.7681),
+    ("Ushuaia", "Argentina", -54.8019, -68.303),
+    ("Nairobi", "Kenya", -1.2921, 36.8219),
+    ("Queenstown", "New Zealand", -45.0312, 168.6626),
+    ("Tromso", "Norway", 69.6492, 18.9553),
+]
+# heavier weights mean more ducks; the Amazon is where most sightings happen
+CLUSTER_WEIGHTS = [30, 15, 12, 8, 6, 8, 5, 7, 4, 5]
+
+DRONES = [
+    ("AeroX", "AeroX Inc", "USA"),
+    ("GeoScan", "Geo Labs", "Brazil"),
+    ("SkyEye", "SkyTech", "UK"),
+    ("Hayabusa", "Kawa Aero", "Japan"),
+    ("Nordlys", "Arctic Systems", "Norway"),
+]
+
+SUPERPOWERS = [
+    ("Tempestade Elétrica", "gera descargas elétricas em area", "bélico"),
+    ("Grito Sônico", "atordoa tudo em um raio de 50 m", "alto risco"),
+    ("Camuflagem", "torna-se invisível a sensores térmicos", "raro"),
+    ("Regeneração", "recupera ferimentos em minutos", "raro"),
+    ("Bico de Plasma", "corta blindagem leve", "bélico raro"),
+    ("Pena Flutuante", "plana por horas sem bater as asas", "comum"),
+]
+
+STATUSES = ["desperto", "transe", "hibernacao profunda"]
+STATUS_WEIGHTS = [20, 30, 50]
+
+# format a canonical measurement in one of the units the loaders accept
+HEIGHT_UNITS = [("cm", 1.0), ("ft", 1 / 30.48), ("m", 0.01)]
+WEIGHT_UNITS = [("g", 1.0), ("kg", 0.001), ("lb", 1 / 453.59237)]
+PRECISION_UNITS = [("m", 1.0), ("yd", 1 / 0.9144), ("cm", 100.0)]
+
+
+def iter_records(count: int, seed: int = 0) -> Iterator[Dict[str, Any]]:
+    """Yield ``count`` raw duck records in the input schema of ``load_and_catalog``.
+
+    The same seed always yields the same records, and a larger ``count`` only
+    appends to the sequence produced by a smaller one.
+    """
+    rng = random.Random(seed)
+    rand = rng.random
+    gauss = rng.gauss
+    # draws are inlined as rand() lookups: Random.choice/choices cost several times more per call
+    cluster_cum = [w / sum(CLUSTER_WEIGHTS) for w in accumulate(CLUSTER_WEIGHTS)]
+    status_cum = [w / sum(STATUS_WEIGHTS) for w in accumulate(STATUS_WEIGHTS)]
+    n_sp, n_drones = len(SUPERPOWERS), len(DRONES)
+    for i in range(count):
+        city, country, clat, clon = CLUSTERS[min(bisect(cluster_cum, rand()), len(CLUSTERS) - 1)]
+        status = STATUSES[min(bisect(status_cum, rand()), len(STATUSES) - 1)]
+
+        height_cm = max(20.0, gauss(150.0, 45.0))
+        # weight grows roughly with the cube of height, with some spread
+        weight_g = max(500.0, 20000.0 * (height_cm / 150.0) ** 3 * rng.lognormvariate(0.0, 0.35))
+        precision_m = rng.expovariate(1 / 8.0)
+
+        if status == "transe":
+            heart_bpm = int(gauss(110, 25))
+        elif status == "desperto":
+            heart_bpm = int(gauss(150, 30)) if rand() < 0.5 else None
+        else:
+            heart_bpm = int(gauss(12, 4)) if rand() < 0.2 else None
+
+        sp = None
+        if rand() < 0.4:
+            name, description, classification = SUPERPOWERS[int(rand() * n_sp)]
+            sp = {"name": name, "description": description, "classification": classification}
+
+        brand, manufacturer, drone_country = DRONES[int(rand() * n_drones)]
+        h_unit, h_factor = HEIGHT_UNITS[int(rand() * 3)]
+        w_unit, w_factor = WEIGHT_UNITS[int(rand() * 3)]
+        p_unit, p_factor = PRECISION_UNITS[int(rand() * 3)]
+
+        yield {
+            "id": f"duck-{i + 1:07d}",
+            "drone": {"serial": f"DR-{1000 + int(rand() * 99000)}", "brand": brand, "manufacturer": manufacturer, "country": drone_country},
+            "height": f"{height_cm * h_factor:.2f} {h_unit}",
+            "weight": f"{weight_g * w_factor:.1f} {w_unit}",
+            "location": {
+                "city": city,
+                "country": country,
+                "latitude": round(min(90.0, max(-90.0, clat + gauss(0.0, 0.6))), 5),
+                "longitude": round((clon + gauss(0.0, 0.6) + 180.0) % 360.0 - 180.0, 5),
+            },
+            "gps_precision": f"{precision_m * p_factor:.1f} {p_unit}",
+            "status": status,
+            "heart_bpm": max(1, heart_bpm) if heart_bpm is not None else None,
+            "mutations": int(rng.expovariate(0.25)),
+            "superpower": sp,
+        }
+
+
+def write_catalog(out: IO[str], count: int, seed: int = 0, fmt: str = "json", batch: int = 5000) -> int:
+    """Stream a synthetic catalog to ``out`` as a JSON array or NDJSON, batch by batch."""
+    if fmt not in ("json", "ndjson"):
+        raise ValueError(f"Unknown format: {fmt}")
+    encode = json.JSONEncoder(ensure_ascii=False).encode
+    sep = ",\n" if fmt == "json" else "\n"
+    lines = []
+    written = 0
+    if fmt == "json":
+        out.write("[\n")
+    for record in iter_records(count, seed):
+        lines.append(encode(record))
+        if len(lines) >= batch:
+            out.write(("" if written == 0 else sep) + sep.join(lines))
+            written += len(lines)
+            lines = []
+    if lines:
+        out.write(("" if written == 0 else sep) + sep.join(lines))
+        written += len(lines)
+    out.write("\n]\n" if fmt == "json" else "\n" if written else "")
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic Primordial Ducks catalog")
+    parser.add_argument("-n", "--count", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--format", choices=["json", "ndjson"], default="json")
+    parser.add_argument("-o", "--output", help="output file (.gz is compressed); defaults to stdout")
+    args = parser.parse_args()
+
+    if args.output is None:
+        write_catalog(sys.stdout, args.count, args.seed, args.format)
+    elif args.output.endswith(".gz"):
+        with gzip.open(args.output, "wt", encoding="utf-8", compresslevel=1) as f:
+            write_catalog(f, args.count, args.seed, args.format)
+    else:
+        with open(args.output, "w", encoding="utf-8") as f:
+            write_catalog(f, args.count, args.seed, args.format)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+import codecs
+import gzip
+import io
+import threading
+from typing import Any, BinaryIO, Callable, Iterator, List, Optional, Tuple, Union
+
+from models import PrimordialDuck
+from validate import QuarantinedRecord, iter_array_records, iter_valid_ducks, parse_ndjson_line
+
+
+GZIP_MAGIC = b"\x1f\x8b"
+_LEADING = b" \t\r\n\xef\xbb\xbf"  # whitespace and the UTF-8 BOM
+# progress is refreshed every this many records, and after every read chunk of a JSON array
+PROGRESS_EVERY = 1000
+READ_CHUNK = 1 << 20
+
+
+def _first_byte(stream: BinaryIO) -> bytes:
+    # look past leading whitespace, then rewind (GzipFile rewinds by re-reading the prefix)
+    while True:
+        chunk = stream.read(4096)
+        if not chunk:
+            stream.seek(0)
+            return b""
+        stripped = chunk.lstrip(_LEADING)
+        if stripped:
+            stream.seek(0)
+            return stripped[:1]
+
+
+def iter_upload(source: BinaryIO, progress: Callable[[float], None] = lambda _: None) -> Iterator[Tuple[int, Any]]:
+    """Yield (line, record) from an uploaded JSON array or NDJSON buffer, gzip or not.
+
+    NDJSON is read line by line straight from the buffer and is the format to
+    use for large uploads. A JSON array cannot be split without decoding it, so
+    it is held in memory once as text (besides the upload itself) and then split
+    into records one at a time. ``progress`` receives the fraction of the work
+    done: for NDJSON the share of the (compressed) input consumed; for arrays
+    reading/decompressing covers the first half and record splitting the second.
+    """
+    size = max(1, source.seek(0, io.SEEK_END))
+    source.seek(0)
+    stream = source
+    if source.read(2) == GZIP_MAGIC:
+        stream = gzip.GzipFile(fileobj=source, mode="rb")
+    source.seek(0)
+
+    if _first_byte(stream) == b"[":
+        # decode chunk by chunk so the only full copy is the final str
+        decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        parts = []
+        while True:
+            chunk = stream.read(READ_CHUNK)
+            if not chunk:
+                break
+            parts.append(decoder.decode(chunk))
+            progress(0.5 * source.tell() / size)
+        parts.append(decoder.decode(b"", final=True))
+        text = "".join(parts)
+        del parts
+        total = max(1, len(text))
+        for n, (line, item, end) in enumerate(iter_array_records(text), 1):
+            if n % PROGRESS_EVERY == 0:
+                progress(0.5 + 0.5 * end / total)
+            yield line, item
+    else:
+        for line, raw in enumerate(stream, 1):
+            if line % PROGRESS_EVERY == 0:
+                progress(source.tell() / size)
+            if raw.strip():
+                yield line, parse_ndjson_line(line, raw)
+    progress(1.0)
+
+
+class IngestJob:
+    """Validate an upload on a background thread.
+
+    ``ducks`` and ``quarantine`` fill in as records are processed, so callers can
+    show partial results while ``progress`` climbs to 1.0. Nothing touches disk.
+    """
+
+    def __init__(self, source: Union[bytes, BinaryIO], key: Any = None):
+        self.key = key
+        self.source = io.BytesIO(source) if isinstance(source, (bytes, bytearray)) else source
+        self.ducks: List[PrimordialDuck] = []
+        self.quarantine: List[QuarantinedRecord] = []
+        self.progress = 0.0
+        self.error: Optional[str] = None
+        self._cancel = threading.Event()
+        self._done = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="ingest", daemon=True)
+
+    def start(self) -> "IngestJob":
+        self._thread.start()
+        return self
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._done.wait(timeout)
+
+    def cancel(self):
+        self._cancel.set()
+
+    def _set_progress(self, value: float):
+        self.progress = value
+
+    def _records(self) -> Iterator[Tuple[int, Any]]:
+        for pair in iter_upload(self.source, self._set_progress):
+            # checked per record, valid or not, so cancelling never waits on a bad stretch
+            if self._cancel.is_set():
+                return
+            yield pair
+
+    def _run(self):
+        try:
+            for duck in iter_valid_ducks(self._records(), self.quarantine):
+                self.ducks.append(duck)
+        except Exception as e:
+            # a broken container (bad gzip stream, malformed or too deeply nested
+            # JSON) or an unexpected bug stops the job; it is reported through
+            # ``error`` and the records already validated stay available
+            self.error = f"{type(e).__name__}: {e}"
+        finally:
+            self._done.set()
@@ -1,8 +1,7 @@
-import json
 from pathlib import Path
+from typing import List, Optional
 
-from .models import DroneInfo, Location, PrimordialDuck, SuperPower
-from .utils import parse_measurement, to_cm, to_grams, precision_to_meters, lookup_reference
+from .validate import QuarantinedRecord, iter_numbered_records, iter_valid_ducks
 from .assess import assess_capture
 from .drone import DroneController
 
@@ -10,53 +9,23 @@ from .drone import DroneController
 DATA_FILE = Path(__file__).parent / "sample_data.json"
 
 
-def load_and_catalog(path: Path):
-	raw = json.loads(path.read_text())
-	ducks = []
-	for item in raw:
-		# parse drone
-		d = item["drone"]
-		drone = DroneInfo(serial=d["serial"], brand=d.get("brand", ""), manufacturer=d.get("manufacturer", ""), country=d.get("country", ""))
+def load_and_catalog(path: Path, quarantine: Optional[List[QuarantinedRecord]] = None):
+	"""Load a JSON array or NDJSON catalog, skipping records that fail validation.
 
-		# parse height
-		h_val, h_unit = parse_measurement(item["height"])
-		height_cm = to_cm(h_val, h_unit)
-
-		w_val, w_unit = parse_measurement(item["weight"])
-		weight_g = to_grams(w_val, w_unit)
-
-		loc = item.get("location", {})
-		ref = lookup_reference(loc.get("latitude", 0.0), loc.get("longitude", 0.0))
-		location = Location(city=loc.get("city", ""), country=loc.get("country", ""), latitude=loc.get("latitude", 0.0), longitude=loc.get("longitude", 0.0), reference_point=ref)
-
-		p_val, p_unit = parse_measurement(item.get("gps_precision", "0 m"))
-		gps_precision_m = precision_to_meters(p_val, p_unit)
-
-		sp = None
-		if item.get("superpower"):
-			spj = item["superpower"]
-			sp = SuperPower(name=spj["name"], description=spj["description"], classification=spj["classification"])
-
-		duck = PrimordialDuck(
-			id=item["id"],
-			drone=drone,
-			height_cm=height_cm,
-			weight_g=weight_g,
-			location=location,
-			gps_precision_m=gps_precision_m,
-			status=item.get("status", "hibernacao profunda"),
-			heart_bpm=item.get("heart_bpm"),
-			mutations=item.get("mutations", 0),
-			superpower=sp,
-		)
-		ducks.append(duck)
-	return ducks
+	Rejected records are appended to ``quarantine`` (when given) with their line.
+	"""
+	if quarantine is None:
+		quarantine = []
+	return list(iter_valid_ducks(iter_numbered_records(path.read_text(encoding="utf-8")), quarantine))
 
 
 def main_demo():
-	ducks = load_and_catalog(DATA_FILE)
+	quarantine = []
+	ducks = load_and_catalog(DATA_FILE, quarantine)
 
 	print(f"Cataloged {len(ducks)} Primordial Ducks:\n")
+	for q in quarantine:
+		print(f"Quarantined line {q.line}: {q.reason}")
 	for d in ducks:
 		print(f"ID: {d.id}")
 		print(f"  Drone: {d.drone.serial} ({d.drone.brand}) from {d.drone.country}")
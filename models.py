@@ -50,3 +50,12 @@ class CaptureAssessment:
     scientific_value: float
     recommended_tooling: List[str]
     rationale: str
+
+
+@dataclass
+class CapturePortfolio:
+    selected: List[str]
+    total_cost: float
+    total_value: float
+    max_risk_score: float  # riskiest duck in the selection (0-100)
+    method: str  # 'dp', 'greedy', or 'none' when nothing could be selected
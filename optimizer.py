@@ -0,0 +1,218 @@
+import heapq
+import math
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from models import CaptureAssessment, CapturePortfolio
+
+
+# the DP table is n x capacity cells; above this the greedy pass is used instead
+MAX_DP_CELLS = 2_000_000
+DEFAULT_CAPACITY = 2_000
+
+
+def value_density(assessment: CaptureAssessment) -> float:
+    return assessment.scientific_value / max(assessment.cost_estimate, 1e-9)
+
+
+def _portfolio(chosen: List[CaptureAssessment], method: str) -> CapturePortfolio:
+    return CapturePortfolio(
+        selected=[a.id for a in chosen],
+        total_cost=round(sum(a.cost_estimate for a in chosen), 2),
+        total_value=round(sum(a.scientific_value for a in chosen), 2),
+        max_risk_score=round(max((a.risk_score for a in chosen), default=0.0), 2),
+        method=method,
+    )
+
+
+def _fill(chosen: List[CaptureAssessment], items: List[CaptureAssessment], budget: float) -> List[CaptureAssessment]:
+    # spend whatever real budget is left on the densest ducks not yet chosen
+    taken = {id(a) for a in chosen}
+    chosen = list(chosen)
+    spent = sum(a.cost_estimate for a in chosen)
+    for a in sorted(items, key=value_density, reverse=True):
+        if id(a) not in taken and spent + a.cost_estimate <= budget:
+            chosen.append(a)
+            spent += a.cost_estimate
+    return chosen
+
+
+def _value(chosen: List[CaptureAssessment]) -> float:
+    return sum(a.scientific_value for a in chosen)
+
+
+def _greedy(items: List[CaptureAssessment], budget: float) -> List[CaptureAssessment]:
+    chosen = []
+    spent = 0.0
+    for a in sorted(items, key=value_density, reverse=True):
+        if spent + a.cost_estimate <= budget:
+            chosen.append(a)
+            spent += a.cost_estimate
+    # classic 1/2-approximation guard: one very valuable duck can beat the ratio order
+    best = max(items, key=lambda a: a.scientific_value, default=None)
+    if best is not None and best.scientific_value > _value(chosen):
+        return [best]
+    return chosen
+
+
+def _knapsack(items: List[CaptureAssessment], budget: float, capacity: int) -> List[CaptureAssessment]:
+    # costs are scaled to integer units and rounded up, so a selection that fits
+    # the scaled capacity always fits the real budget
+    unit = budget / capacity
+    weights = [max(1, math.ceil(a.cost_estimate / unit - 1e-9)) for a in items]
+    best = [0.0] * (capacity + 1)
+    taken: List[Tuple[int, bytes]] = []
+    for a, w in zip(items, weights):
+        if w > capacity:
+            taken.append((w, b""))
+            continue
+        v = a.scientific_value
+        head = best[:capacity + 1 - w]
+        tail = best[w:]
+        take = [h + v > t for h, t in zip(head, tail)]
+        best[w:] = [h + v if k else t for h, t, k in zip(head, tail, take)]
+        taken.append((w, bytes(take)))
+
+    chosen = []
+    c = capacity
+    for a, (w, take) in zip(reversed(items), reversed(taken)):
+        if take and c >= w and take[c - w]:
+            chosen.append(a)
+            c -= w
+    chosen.reverse()
+    return chosen
+
+
+def optimize_portfolio(
+    assessments: Iterable[CaptureAssessment],
+    budget: float,
+    max_risk: float = 100.0,
+    capacity: int = DEFAULT_CAPACITY,
+) -> CapturePortfolio:
+    """Pick the ducks that maximize total scientific value within ``budget``.
+
+    Ducks above ``max_risk`` are never selected. Small catalogs are solved with a
+    0/1 knapsack over costs scaled to ``capacity`` units; catalogs whose table
+    would exceed MAX_DP_CELLS fall back to a greedy value-per-cost pass.
+    Rounding costs up wastes some budget, so the DP answer is topped up
+    greedily and never returned when the plain greedy pass does better.
+    """
+    if capacity <= 0:
+        raise ValueError(f"capacity must be positive, got {capacity}")
+    items = [
+        a for a in assessments
+        if a.risk_score <= max_risk and a.cost_estimate <= budget and a.scientific_value > 0
+    ]
+    if not items or budget <= 0:
+        return _portfolio([], "none")
+    if len(items) * capacity > MAX_DP_CELLS:
+        return _portfolio(_greedy(items, budget), "greedy")
+    greedy = _greedy(items, budget)
+    dp = _fill(_knapsack(items, budget, capacity), items, budget)
+    if _value(greedy) > _value(dp):
+        return _portfolio(greedy, "greedy")
+    return _portfolio(dp, "dp")
+
+
+class CaptureShortlist:
+    """Top-K ranking of assessments that stays current as single ducks change.
+
+    Backed by an indexed binary heap: update/remove are O(log n) and top(k) walks
+    only the k best entries, so the catalog is never re-sorted.
+    """
+
+    def __init__(
+        self,
+        assessments: Iterable[CaptureAssessment] = (),
+        key: Callable[[CaptureAssessment], float] = value_density,
+        max_risk: Optional[float] = None,
+    ):
+        self.key = key
+        self.max_risk = max_risk
+        self._heap: List[Tuple[float, str]] = []
+        self._pos: Dict[str, int] = {}
+        self._items: Dict[str, CaptureAssessment] = {}
+        # bulk load with a single O(n) heapify instead of n sift-ups
+        for a in assessments:
+            if self.max_risk is None or a.risk_score <= self.max_risk:
+                self._items[a.id] = a
+        self._heap = [(-key(a), a.id) for a in self._items.values()]
+        heapq.heapify(self._heap)
+        self._pos = {duck_id: i for i, (_, duck_id) in enumerate(self._heap)}
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __contains__(self, duck_id: str) -> bool:
+        return duck_id in self._pos
+
+    def update(self, assessment: CaptureAssessment):
+        """Insert or re-rank one duck after its assessment changed."""
+        if self.max_risk is not None and assessment.risk_score > self.max_risk:
+            self.remove(assessment.id)
+            return
+        entry = (-self.key(assessment), assessment.id)
+        self._items[assessment.id] = assessment
+        i = self._pos.get(assessment.id)
+        if i is None:
+            self._heap.append(entry)
+            self._pos[assessment.id] = len(self._heap) - 1
+            self._sift_up(len(self._heap) - 1)
+            return
+        old = self._heap[i]
+        self._heap[i] = entry
+        if entry < old:
+            self._sift_up(i)
+        else:
+            self._sift_down(i)
+
+    def remove(self, duck_id: str):
+        i = self._pos.pop(duck_id, None)
+        if i is None:
+            return
+        del self._items[duck_id]
+        last = self._heap.pop()
+        if i < len(self._heap):
+            self._heap[i] = last
+            self._pos[last[1]] = i
+            self._sift_up(i)
+            self._sift_down(self._pos[last[1]])
+
+    def top(self, k: int) -> List[CaptureAssessment]:
+        heap = self._heap
+        result = []
+        frontier = [(heap[0], 0)] if heap else []
+        while frontier and len(result) < k:
+            (_, duck_id), i = heapq.heappop(frontier)
+            result.append(self._items[duck_id])
+            for child in (2 * i + 1, 2 * i + 2):
+                if child < len(heap):
+                    heapq.heappush(frontier, (heap[child], child))
+        return result
+
+    def _swap(self, i: int, j: int):
+        heap = self._heap
+        heap[i], heap[j] = heap[j], heap[i]
+        self._pos[heap[i][1]] = i
+        self._pos[heap[j][1]] = j
+
+    def _sift_up(self, i: int):
+        heap = self._heap
+        while i > 0:
+            parent = (i - 1) // 2
+            if heap[i] >= heap[parent]:
+                break
+            self._swap(i, parent)
+            i = parent
+
+    def _sift_down(self, i: int):
+        heap = self._heap
+        n = len(heap)
+        while True:
+            smallest = i
+            for child in (2 * i + 1, 2 * i + 2):
+                if child < n and heap[child] < heap[smallest]:
+                    smallest = child
+            if smallest == i:
+                return
+            self._swap(i, smallest)
+            i = smallest
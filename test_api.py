@@ -0,0 +1,159 @@
+import asyncio
+import json
+
+from Desafio_Bonus.api import CatalogService, start_server
+from Desafio_Bonus.main import DATA_FILE
+
+
+def _service():
+    service = CatalogService()
+    service.load(DATA_FILE)
+    return service
+
+
+def test_assess_batch_streams_ndjson():
+    service = _service()
+    resp = service.dispatch("POST", "/assess", json.dumps({"ids": ["duck-001", "duck-003"]}).encode())
+    assert resp.status == 200
+    assert resp.headers["Content-Type"] == "application/x-ndjson"
+    assert [row["id"] for row in resp.lines()] == ["duck-001", "duck-003"]
+
+
+def test_responses_cached_per_catalog_version():
+    service = _service()
+    first = service.dispatch("GET", "/ducks").lines()
+    cached = service.dispatch("GET", "/ducks")
+    assert isinstance(cached.chunks, list)
+    assert cached.lines() == first
+    etag = cached.headers["ETag"]
+    assert service.dispatch("GET", "/ducks", headers={"if-none-match": etag}).status == 304
+    service.replace(service.ducks[:1])
+    assert len(service.dispatch("GET", "/ducks", headers={"if-none-match": etag}).lines()) == 1
+
+
+def test_errors():
+    service = _service()
+    assert service.dispatch("POST", "/plan", b"{").status == 400
+    assert service.dispatch("POST", "/plan", b'{"ids": ["nope"]}').status == 404
+    assert service.dispatch("GET", "/plan").status == 405
+    assert service.dispatch("GET", "/missing").status == 404
+
+
+def test_keep_alive_over_socket():
+    async def run():
+        server = await start_server(_service(), "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        body = b'{"seed": 1}'
+        for _ in range(2):
+            writer.write(b"POST /plan HTTP/1.1\r\nHost: x\r\nContent-Length: %d\r\n\r\n%s" % (len(body), body))
+            await writer.drain()
+            head = await reader.readuntil(b"\r\n\r\n")
+            assert head.startswith(b"HTTP/1.1 200")
+            assert b"Transfer-Encoding: chunked" in head
+            data = b""
+            while True:
+                size = int(await reader.readline(), 16)
+                chunk = await reader.readexactly(size + 2)
+                if size == 0:
+                    break
+                data += chunk[:-2]
+            assert len(data.splitlines()) == 3
+        writer.close()
+        server.close()
+        await server.wait_closed()
+
+    asyncio.run(run())
+
+
+def test_malformed_payloads_get_400():
+    service = _service()
+    assert service.dispatch("POST", "/assess", b'{"ids": [["x"]]}').status == 400
+    assert service.dispatch("POST", "/plan", b'{"seed": [1]}').status == 400
+    assert service.dispatch("POST", "/plan", b'{"seed": "abc"}').status == 200
+
+
+def test_unexpected_errors_get_500():
+    service = _service()
+    service.ducks = [None]
+    assert service.dispatch("POST", "/plan", b"{}").status == 500
+
+
+def test_cache_is_bounded(monkeypatch):
+    import Desafio_Bonus.api as api
+
+    monkeypatch.setattr(api, "MAX_CACHE_ENTRIES", 3)
+    service = _service()
+    for i in range(10):
+        service.dispatch("POST", "/plan", json.dumps({"seed": i}).encode()).lines()
+    assert len(service._cache) == 3
+    for lat in range(5):
+        service.dispatch("POST", "/assess", json.dumps({"base_lat": lat}).encode()).lines()
+    assert sum(1 for key in service._cache if key[1] == "assess") == 1
+
+
+def test_bad_content_length_gets_400():
+    async def run():
+        server = await start_server(_service(), "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        for value in (b"abc", b"-5"):
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b"POST /plan HTTP/1.1\r\nContent-Length: " + value + b"\r\n\r\n")
+            await writer.drain()
+            assert (await reader.readline()).startswith(b"HTTP/1.1 400")
+            writer.close()
+        server.close()
+        await server.wait_closed()
+
+    asyncio.run(run())
+
+
+async def _with_server(client):
+    server = await start_server(_service(), "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        await client(reader, writer)
+    finally:
+        writer.close()
+        server.close()
+        await server.wait_closed()
+
+
+def test_chunked_request_body_is_refused():
+    async def client(reader, writer):
+        writer.write(b'POST /assess HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n6\r\n{"a":\r\n0\r\n\r\n')
+        await writer.drain()
+        head = await reader.readuntil(b"\r\n\r\n")
+        assert head.startswith(b"HTTP/1.1 501")
+        assert b"Connection: close" in head
+        length = int(head.split(b"Content-Length: ")[1].split(b"\r\n")[0])
+        await reader.readexactly(length)
+        assert await reader.read() == b""
+
+    asyncio.run(_with_server(client))
+
+
+def test_http10_gets_unchunked_ndjson():
+    async def client(reader, writer):
+        writer.write(b"GET /ducks HTTP/1.0\r\n\r\n")
+        await writer.drain()
+        head, _, body = (await reader.read()).partition(b"\r\n\r\n")
+        assert b"Transfer-Encoding" not in head
+        assert b"Connection: close" in head
+        assert [json.loads(line)["id"] for line in body.splitlines()] == ["duck-001", "duck-002", "duck-003"]
+
+    asyncio.run(_with_server(client))
+
+
+def test_expect_100_continue():
+    async def client(reader, writer):
+        body = b'{"ids": ["duck-002"]}'
+        writer.write(b"POST /assess HTTP/1.1\r\nExpect: 100-continue\r\nContent-Length: %d\r\n\r\n" % len(body))
+        await writer.drain()
+        assert await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), 2) == b"HTTP/1.1 100 Continue\r\n\r\n"
+        writer.write(body)
+        await writer.drain()
+        assert (await reader.readuntil(b"\r\n\r\n")).startswith(b"HTTP/1.1 200")
+
+    asyncio.run(_with_server(client))
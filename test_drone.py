@@ -0,0 +1,32 @@
+import random
+
+from Desafio_Bonus.models import PrimordialDuck, DroneInfo, Location, SuperPower
+from Desafio_Bonus import drone as dr
+
+
+def _duck(id, height_cm=150, weight_g=20000, classification=None):
+    drone = DroneInfo(serial="x", brand="b", manufacturer="m", country="BR")
+    loc = Location(city="c", country="BR", latitude=0.0, longitude=0.0)
+    sp = SuperPower(name="p", description="d", classification=classification) if classification else None
+    return PrimordialDuck(id=id, drone=drone, height_cm=height_cm, weight_g=weight_g, location=loc, gps_precision_m=5, status="transe", superpower=sp)
+
+
+def test_plan_catalog_matches_plan_attack():
+    ducks = [_duck(f"d{i}", height_cm=80 + i * 10, weight_g=10000 * i, classification=["Bélico", "raro", None][i % 3]) for i in range(20)]
+    dc = dr.DroneController(id="c")
+    batch = dc.plan_catalog(ducks, rng=random.Random(7))
+    random.seed(7)
+    single = {d.id: dc.plan_attack(d) for d in ducks}
+    assert batch == single
+
+
+def test_plan_catalog_shares_plan_strings():
+    ducks = [_duck(f"d{i}") for i in range(50)]
+    plans = dr.DroneController(id="c").plan_catalog(ducks, rng=random.Random(1))
+    assert len({id(p) for p in plans.values()}) == len(set(plans.values()))
+
+
+def test_identify_weakness_names():
+    random.seed(3)
+    names = dr.DroneController(id="c").identify_weakness(_duck("d", height_cm=250, weight_g=60000, classification="alto risco"))
+    assert names[:3] == ["slow_mobility", "top_attack_vulnerable", "requires_heavy_armor"]
@@ -0,0 +1,29 @@
+import io
+import json
+
+from Desafio_Bonus import generate as g
+from Desafio_Bonus.validate import validate_text
+
+
+def test_seeded_output_is_reproducible():
+    a, b = io.StringIO(), io.StringIO()
+    g.write_catalog(a, 200, seed=3)
+    g.write_catalog(b, 200, seed=3)
+    assert a.getvalue() == b.getvalue()
+    assert list(g.iter_records(50, seed=3)) == list(g.iter_records(200, seed=3))[:50]
+
+
+def test_generated_catalog_passes_validation():
+    out = io.StringIO()
+    assert g.write_catalog(out, 500, seed=1) == 500
+    report = validate_text(out.getvalue())
+    assert len(report.ducks) == 500
+    assert not report.quarantine
+    assert {d.status for d in report.ducks} == {"desperto", "transe", "hibernacao profunda"}
+
+
+def test_ndjson_matches_json_array():
+    as_json, as_ndjson = io.StringIO(), io.StringIO()
+    g.write_catalog(as_json, 20, seed=7, fmt="json", batch=3)
+    g.write_catalog(as_ndjson, 20, seed=7, fmt="ndjson", batch=3)
+    assert json.loads(as_json.getvalue()) == [json.loads(line) for line in as_ndjson.getvalue().splitlines()]
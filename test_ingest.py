@@ -0,0 +1,79 @@
+import gzip
+import io
+import json
+
+from Desafio_Bonus import generate as g
+from Desafio_Bonus.ingest import IngestJob
+
+
+def _catalog(fmt, count=50):
+    out = io.StringIO()
+    g.write_catalog(out, count, seed=2, fmt=fmt)
+    return out.getvalue().encode("utf-8")
+
+
+def _run(data):
+    job = IngestJob(data).start()
+    assert job.wait(10)
+    return job
+
+
+def test_ingests_json_and_ndjson_bytes():
+    for fmt in ("json", "ndjson"):
+        job = _run(_catalog(fmt))
+        assert job.error is None
+        assert len(job.ducks) == 50
+        assert job.progress == 1.0
+
+
+def test_ingests_gzip_upload_with_quarantine():
+    lines = _catalog("ndjson", 10).decode().splitlines()
+    lines.insert(3, "{broken")
+    job = _run(gzip.compress("\n".join(lines).encode()))
+    assert len(job.ducks) == 10
+    assert [q.line for q in job.quarantine] == [4]
+
+
+def test_gzip_json_array_from_file_object():
+    job = _run(io.BytesIO(gzip.compress(_catalog("json", 5))))
+    assert [d.id for d in job.ducks] == [f"duck-{i:07d}" for i in range(1, 6)]
+
+
+def test_malformed_array_keeps_partial_results():
+    data = json.dumps(json.loads(_catalog("json", 3))).encode()[:-1] + b" oops"
+    job = _run(data)
+    assert job.error
+    assert len(job.ducks) == 3
+
+
+def test_unexpected_errors_are_reported(monkeypatch):
+    import Desafio_Bonus.ingest as ingest
+
+    def boom(numbered, quarantine):
+        yield from ()
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(ingest, "iter_valid_ducks", boom)
+    job = _run(_catalog("ndjson", 5))
+    assert job.error == "RuntimeError: boom"
+
+
+def test_cancel_stops_on_invalid_rows():
+    job = IngestJob(b"{}\n" * 100000)
+    job.cancel()
+    job.start()
+    assert job.wait(10)
+    assert len(job.quarantine) == 0
+
+
+def test_json_array_reports_progress_while_reading(monkeypatch):
+    import Desafio_Bonus.ingest as ingest
+
+    monkeypatch.setattr(ingest, "READ_CHUNK", 256)
+    seen = []
+    records = ingest.iter_upload(io.BytesIO(gzip.compress(_catalog("json", 20))), seen.append)
+    next(records)
+    assert seen and 0 < seen[-1] <= 0.5
+    list(records)
+    assert seen == sorted(seen)
+    assert seen[-1] == 1.0
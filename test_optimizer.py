@@ -0,0 +1,79 @@
+import itertools
+import random
+
+import pytest
+
+from Desafio_Bonus.models import CaptureAssessment
+from Desafio_Bonus import optimizer as opt
+
+
+def _a(id, cost, risk, value):
+    return CaptureAssessment(id=id, cost_estimate=cost, military_power="light", risk_score=risk, scientific_value=value, recommended_tooling=[], rationale="")
+
+
+def _brute_force(items, budget, max_risk):
+    best = 0.0
+    ok = [a for a in items if a.risk_score <= max_risk]
+    for r in range(len(ok) + 1):
+        for combo in itertools.combinations(ok, r):
+            if sum(a.cost_estimate for a in combo) <= budget:
+                best = max(best, sum(a.scientific_value for a in combo))
+    return best
+
+
+def test_optimize_portfolio_matches_brute_force():
+    rng = random.Random(5)
+    items = [_a(f"d{i}", rng.choice([500, 1000, 1500, 2500]), rng.uniform(0, 100), rng.uniform(1, 120)) for i in range(12)]
+    result = opt.optimize_portfolio(items, budget=5000, max_risk=70)
+    assert result.method == "dp"
+    assert result.total_cost <= 5000
+    chosen = [a for a in items if a.id in result.selected]
+    assert all(a.risk_score <= 70 for a in chosen)
+    assert abs(result.total_value - round(_brute_force(items, 5000, 70), 2)) < 0.02
+
+
+def test_optimize_portfolio_greedy_fallback():
+    items = [_a(f"d{i}", 1000.0 + i, 10, 10.0 + i % 7) for i in range(5000)]
+    result = opt.optimize_portfolio(items, budget=20000)
+    assert result.method == "greedy"
+    assert result.total_cost <= 20000
+    assert result.selected
+
+
+def test_shortlist_updates_incrementally():
+    items = [_a(f"d{i}", 1000, 10, float(i)) for i in range(100)]
+    shortlist = opt.CaptureShortlist(items, max_risk=50)
+    assert [a.id for a in shortlist.top(3)] == ["d99", "d98", "d97"]
+    shortlist.update(_a("d5", 1000, 10, 500.0))
+    shortlist.update(_a("d99", 1000, 90, 99.0))
+    assert "d99" not in shortlist
+    assert [a.id for a in shortlist.top(3)] == ["d5", "d98", "d97"]
+    shortlist.remove("d98")
+    assert [a.id for a in shortlist.top(2)] == ["d5", "d97"]
+    assert len(shortlist) == 98
+
+
+def test_optimize_portfolio_non_aligned_costs():
+    rng = random.Random(11)
+    items = [_a(f"d{i}", rng.uniform(300, 4000), rng.uniform(0, 100), rng.uniform(1, 120)) for i in range(14)]
+    for budget in (3000, 7777.7, 12345.6):
+        result = opt.optimize_portfolio(items, budget=budget, max_risk=60, capacity=50)
+        greedy = opt.optimize_portfolio(items, budget=budget, max_risk=60, capacity=10**7)
+        assert greedy.method == "greedy"
+        assert result.total_cost <= budget
+        assert result.total_value >= greedy.total_value
+        assert result.total_value >= 0.9 * round(_brute_force(items, budget, 60), 2)
+
+
+def test_optimize_portfolio_rejects_bad_capacity():
+    with pytest.raises(ValueError):
+        opt.optimize_portfolio([_a("d", 10, 0, 1)], budget=100, capacity=0)
+
+
+def test_portfolio_reports_peak_risk_and_empty_method():
+    items = [_a("a", 100, 20, 5), _a("b", 100, 45, 5)]
+    result = opt.optimize_portfolio(items, budget=500)
+    assert result.max_risk_score == 45
+    empty = opt.optimize_portfolio(items, budget=500, max_risk=10)
+    assert empty.method == "none"
+    assert empty.selected == []
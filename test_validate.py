@@ -0,0 +1,71 @@
+import json
+
+import pytest
+
+from Desafio_Bonus import validate as v
+
+
+def _record(**overrides):
+    rec = {
+        "id": "duck-x",
+        "drone": {"serial": "DR-1", "brand": "b", "manufacturer": "m", "country": "BR"},
+        "height": "6 ft",
+        "weight": "2 kg",
+        "location": {"city": "c", "country": "BR", "latitude": "-3.1", "longitude": -60.0},
+        "gps_precision": "5 yd",
+        "status": "transe",
+        "heart_bpm": "90",
+        "mutations": 2,
+    }
+    rec.update(overrides)
+    return rec
+
+
+def test_validate_record_coerces_types():
+    duck = v.validate_record(_record())
+    assert abs(duck.height_cm - 182.88) < 1e-6
+    assert duck.weight_g == 2000.0
+    assert duck.location.latitude == -3.1
+    assert duck.heart_bpm == 90
+
+
+def test_normalize_status_spellings():
+    assert v.normalize_status("hibernação") == "hibernacao profunda"
+    assert v.normalize_status("Hibernacao  Profunda") == "hibernacao profunda"
+    assert v.normalize_status(None) == "hibernacao profunda"
+
+
+def test_invalid_rows_are_quarantined_with_lines():
+    rows = [_record(id="a"), _record(id="b", height="tall"), _record(id="a"), _record(id="c", status="dançando")]
+    text = "[\n" + ",\n".join(json.dumps(r) for r in rows) + "\n]"
+    report = v.validate_text(text)
+    assert [d.id for d in report.ducks] == ["a"]
+    assert [q.line for q in report.quarantine] == [3, 4, 5]
+
+
+def test_ndjson_bad_line_does_not_stop_ingest():
+    text = json.dumps(_record(id="a")) + "\n{not json\n" + json.dumps(_record(id="b")) + "\n"
+    report = v.validate_text(text)
+    assert [d.id for d in report.ducks] == ["a", "b"]
+    assert report.quarantine[0].line == 2
+
+
+def test_non_finite_numbers_are_quarantined():
+    rows = [
+        _record(id="a"),
+        _record(id="b", heart_bpm="1e400"),
+        _record(id="c", mutations="inf"),
+        _record(id="e", location={"latitude": "nan", "longitude": 0}),
+    ]
+    text = "\n".join(json.dumps(r) for r in rows)
+    text += '\n{"id": "d", "drone": {"serial": "x"}, "height": NaN, "weight": Infinity}'
+    report = v.validate_text(text)
+    assert [d.id for d in report.ducks] == ["a"]
+    assert [q.line for q in report.quarantine] == [2, 3, 4, 5]
+
+
+def test_non_integral_counts_are_quarantined():
+    assert v.validate_record(_record(mutations="3.0", heart_bpm=90.0)).mutations == 3
+    for overrides in ({"mutations": 2.7}, {"heart_bpm": "90.9"}):
+        with pytest.raises(v.RecordError):
+            v.validate_record(_record(**overrides))
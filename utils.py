@@ -34,44 +34,41 @@ def parse_measurement(value_with_unit: str) -> Tuple[float, str]:
         return val, unit
 
 
+# unit -> factor tables; the converters below fall back to the base unit
+LENGTH_TO_CM = {
+    "cm": 1.0, "centimeter": 1.0, "centimetro": 1.0, "centimetros": 1.0,
+    "m": 100.0, "meter": 100.0, "metros": 100.0,
+    "ft": 30.48, "feet": 30.48, "foot": 30.48, "pés": 30.48, "pe": 30.48, "pé": 30.48,
+    "in": 2.54, "inch": 2.54, "polegada": 2.54, "polegadas": 2.54,
+}
+
+MASS_TO_G = {
+    "g": 1.0, "gram": 1.0, "grama": 1.0, "gramas": 1.0,
+    "kg": 1000.0, "kilogram": 1000.0, "kilograma": 1000.0, "kilogramas": 1000.0,
+    "lb": 453.59237, "lbs": 453.59237, "pound": 453.59237, "libra": 453.59237, "libras": 453.59237,
+}
+
+PRECISION_TO_M = {
+    "m": 1.0, "meter": 1.0, "metros": 1.0,
+    "cm": 0.01, "centimetro": 0.01, "centimetros": 0.01,
+    "yd": 0.9144, "yard": 0.9144, "yards": 0.9144, "jarda": 0.9144, "jardas": 0.9144,
+    "mm": 0.001,
+}
+
+
 def to_cm(value: float, unit: str) -> float:
-    unit = unit.lower()
-    if unit in ("cm", "centimeter", "centimetro", "centimetros"):
-        return value
-    if unit in ("m", "meter", "metros", "metros"):
-        return value * 100.0
-    if unit in ("ft", "feet", "foot", "pés", "pe", "pé"):
-        return feet_to_cm(value)
-    if unit in ("in", "inch", "polegada", "polegadas"):
-        return value * 2.54
     # default assume cm
-    return value
+    return value * LENGTH_TO_CM.get(unit.lower(), 1.0)
 
 
 def to_grams(value: float, unit: str) -> float:
-    unit = unit.lower()
-    if unit in ("g", "gram", "grama", "gramas"):
-        return value
-    if unit in ("kg", "kilogram", "kilograma", "kilogramas"):
-        return value * 1000.0
-    if unit in ("lb", "lbs", "pound", "libra", "libras"):
-        return pounds_to_grams(value)
     # default assume grams
-    return value
+    return value * MASS_TO_G.get(unit.lower(), 1.0)
 
 
 def precision_to_meters(value: float, unit: str) -> float:
-    unit = unit.lower()
-    if unit in ("m", "meter", "metros"):
-        return value
-    if unit in ("cm", "centimetro", "centimetros"):
-        return value / 100.0
-    if unit in ("yd", "yard", "yards", "jarda", "jardas"):
-        return yards_to_meters(value)
-    if unit in ("mm",):
-        return value / 1000.0
     # default assume meters
-    return value
+    return value * PRECISION_TO_M.get(unit.lower(), 1.0)
 
 
 # small reference points mapping (stub)
@@ -0,0 +1,291 @@
+import json
+import math
+import re
+import unicodedata
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from models import DroneInfo, Location, PrimordialDuck, SuperPower
+from utils import LENGTH_TO_CM, MASS_TO_G, PRECISION_TO_M, lookup_reference
+
+
+STATUSES = ("desperto", "transe", "hibernacao profunda")
+DEFAULT_STATUS = "hibernacao profunda"
+
+# accent-free, lowercased spellings -> canonical status
+STATUS_ALIASES = {
+    "desperto": "desperto",
+    "acordado": "desperto",
+    "awake": "desperto",
+    "transe": "transe",
+    "trance": "transe",
+    "hibernacao": "hibernacao profunda",
+    "hibernacao profunda": "hibernacao profunda",
+    "hibernation": "hibernacao profunda",
+    "deep hibernation": "hibernacao profunda",
+}
+
+_MEASUREMENT_RE = re.compile(r"\s*([-+]?(?:\d+(?:[.,]\d*)?|[.,]\d+)(?:e[-+]?\d+)?)\s*([^\W\d_]+)?\s*$", re.IGNORECASE)
+_WS_RE = re.compile(r"[ \t\n\r]*")
+
+
+class RecordError(ValueError):
+    """Raised for a single record that does not match the input schema."""
+
+
+@dataclass
+class QuarantinedRecord:
+    line: int
+    reason: str
+    record: Any
+
+
+@dataclass
+class ValidationReport:
+    ducks: List[PrimordialDuck] = field(default_factory=list)
+    quarantine: List[QuarantinedRecord] = field(default_factory=list)
+
+
+@lru_cache(maxsize=256)
+def _fold_status(value: str) -> Optional[str]:
+    # bounded: dirty uploads can carry any number of distinct bogus statuses
+    folded = unicodedata.normalize("NFKD", value).encode("ascii", "ignore").decode("ascii")
+    return STATUS_ALIASES.get(" ".join(folded.lower().replace("_", " ").split()))
+
+
+def normalize_status(value: Any) -> str:
+    """Map any known spelling ('Hibernação', 'hibernacao profunda', ...) to its canonical status."""
+    if value is None:
+        return DEFAULT_STATUS
+    if not isinstance(value, str):
+        raise RecordError(f"status must be a string, got {type(value).__name__}")
+    canonical = STATUS_ALIASES.get(value)
+    if canonical is None:
+        canonical = _fold_status(value)
+    if canonical is None:
+        raise RecordError(f"unknown status: {value!r}")
+    return canonical
+
+
+def _measurement(value: Any, table: Dict[str, float], name: str) -> float:
+    # bare numbers are taken in the table's base unit
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return _finite(float(value), name)
+    if not isinstance(value, str):
+        raise RecordError(f"{name} must be a string like '6 ft', got {type(value).__name__}")
+    m = _MEASUREMENT_RE.match(value)
+    if not m:
+        raise RecordError(f"cannot parse {name}: {value!r}")
+    number = float(m.group(1).replace(",", "."))
+    unit = m.group(2)
+    if unit is None:
+        return _finite(number, name)
+    factor = table.get(unit.lower())
+    if factor is None:
+        raise RecordError(f"unknown {name} unit: {unit!r}")
+    return _finite(number * factor, name)
+
+
+def _finite(number: float, name: str) -> float:
+    # NaN slips through every range comparison and inf through most
+    if not math.isfinite(number):
+        raise RecordError(f"{name} must be a finite number, got {number}")
+    return number
+
+
+def _float(value: Any, name: str, low: float, high: float) -> float:
+    if isinstance(value, bool):
+        raise RecordError(f"{name} must be a number")
+    try:
+        number = float(value)
+    except (TypeError, ValueError, OverflowError):
+        raise RecordError(f"{name} must be a number, got {value!r}") from None
+    _finite(number, name)
+    if not low <= number <= high:
+        raise RecordError(f"{name} out of range: {number}")
+    return number
+
+
+def _int(value: Any, name: str) -> int:
+    if isinstance(value, bool):
+        raise RecordError(f"{name} must be an integer")
+    if isinstance(value, int):
+        number = value
+    else:
+        try:
+            as_float = _finite(float(value), name)
+            number = int(as_float)
+        except (TypeError, ValueError, OverflowError):
+            raise RecordError(f"{name} must be an integer, got {value!r}") from None
+        # 90.0 is fine, 90.9 is not: truncating would hide a bad value
+        if as_float != number:
+            raise RecordError(f"{name} must be an integer, got {value!r}")
+    if number < 0:
+        raise RecordError(f"{name} must not be negative: {number}")
+    return number
+
+
+def _str(value: Any, name: str, required: bool = True) -> str:
+    if value is None:
+        if required:
+            raise RecordError(f"missing {name}")
+        return ""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    raise RecordError(f"{name} must be a string, got {type(value).__name__}")
+
+
+def validate_record(item: Any) -> PrimordialDuck:
+    """Check one raw record against the input schema, coercing it into a PrimordialDuck.
+
+    Raises RecordError describing the first problem found.
+    """
+    if not isinstance(item, dict):
+        raise RecordError(f"record must be an object, got {type(item).__name__}")
+
+    d = item.get("drone")
+    if not isinstance(d, dict):
+        raise RecordError("missing drone")
+    drone = DroneInfo(
+        serial=_str(d.get("serial"), "drone.serial"),
+        brand=_str(d.get("brand"), "drone.brand", False),
+        manufacturer=_str(d.get("manufacturer"), "drone.manufacturer", False),
+        country=_str(d.get("country"), "drone.country", False),
+    )
+
+    if item.get("height") is None:
+        raise RecordError("missing height")
+    if item.get("weight") is None:
+        raise RecordError("missing weight")
+    height_cm = _measurement(item["height"], LENGTH_TO_CM, "height")
+    weight_g = _measurement(item["weight"], MASS_TO_G, "weight")
+    gps_precision_m = _measurement(item.get("gps_precision") or "0 m", PRECISION_TO_M, "gps_precision")
+    if height_cm <= 0 or weight_g <= 0:
+        raise RecordError("height and weight must be positive")
+    if gps_precision_m < 0:
+        raise RecordError("gps_precision must not be negative")
+
+    loc = item.get("location") or {}
+    if not isinstance(loc, dict):
+        raise RecordError("location must be an object")
+    lat = _float(loc.get("latitude", 0.0), "location.latitude", -90.0, 90.0)
+    lon = _float(loc.get("longitude", 0.0), "location.longitude", -180.0, 180.0)
+    location = Location(
+        city=_str(loc.get("city"), "location.city", False),
+        country=_str(loc.get("country"), "location.country", False),
+        latitude=lat,
+        longitude=lon,
+        reference_point=lookup_reference(lat, lon),
+    )
+
+    sp = None
+    spj = item.get("superpower")
+    if spj:
+        if not isinstance(spj, dict):
+            raise RecordError("superpower must be an object")
+        sp = SuperPower(
+            name=_str(spj.get("name"), "superpower.name"),
+            description=_str(spj.get("description"), "superpower.description", False),
+            classification=_str(spj.get("classification"), "superpower.classification"),
+        )
+
+    heart_bpm = item.get("heart_bpm")
+    mutations = item.get("mutations")
+
+    return PrimordialDuck(
+        id=_str(item.get("id"), "id"),
+        drone=drone,
+        height_cm=height_cm,
+        weight_g=weight_g,
+        location=location,
+        gps_precision_m=gps_precision_m,
+        status=normalize_status(item.get("status")),
+        heart_bpm=None if heart_bpm is None else _int(heart_bpm, "heart_bpm"),
+        mutations=0 if mutations is None else _int(mutations, "mutations"),
+        superpower=sp,
+    )
+
+
+def iter_valid_ducks(numbered: Iterable[Tuple[int, Any]], quarantine: List[QuarantinedRecord]) -> Iterator[PrimordialDuck]:
+    """Single pass over (line, record) pairs: valid ducks are yielded as they are
+    validated, invalid ones (and repeated ids) are appended to ``quarantine``.
+    """
+    seen = set()
+    for line, item in numbered:
+        if isinstance(item, QuarantinedRecord):
+            # already rejected upstream (e.g. an NDJSON line that is not JSON)
+            quarantine.append(item)
+            continue
+        try:
+            duck = validate_record(item)
+        except RecordError as e:
+            quarantine.append(QuarantinedRecord(line=line, reason=str(e), record=item))
+            continue
+        if duck.id in seen:
+            quarantine.append(QuarantinedRecord(line=line, reason=f"duplicate id: {duck.id!r}", record=item))
+            continue
+        seen.add(duck.id)
+        yield duck
+
+
+def iter_array_records(text: str, pos: int = 0) -> Iterator[Tuple[int, Any, int]]:
+    """Yield (line, record, end offset) for each element of the JSON array at ``pos``.
+
+    Elements are decoded one at a time so the line where each record starts is
+    known; a syntax error in the array itself still raises JSONDecodeError.
+    """
+    decoder = json.JSONDecoder()
+    pos = _WS_RE.match(text, pos).end()
+    if not text.startswith("[", pos):
+        raise json.JSONDecodeError("Expecting '['", text, pos)
+    line = 1 + text.count("\n", 0, pos)
+    last = pos
+    pos = _WS_RE.match(text, pos + 1).end()
+    if text.startswith("]", pos):
+        return
+    while True:
+        line += text.count("\n", last, pos)
+        last = pos
+        item, pos = decoder.raw_decode(text, pos)
+        yield line, item, pos
+        pos = _WS_RE.match(text, pos).end()
+        if text.startswith(",", pos):
+            pos = _WS_RE.match(text, pos + 1).end()
+            continue
+        if text.startswith("]", pos):
+            return
+        raise json.JSONDecodeError("Expecting ',' delimiter", text, pos)
+
+
+def parse_ndjson_line(line: int, raw: Union[str, bytes]) -> Any:
+    """Decode one NDJSON line; undecodable lines come back as a QuarantinedRecord."""
+    try:
+        return json.loads(raw)
+    except ValueError as e:
+        reason = e.msg if isinstance(e, json.JSONDecodeError) else str(e)
+        return QuarantinedRecord(line=line, reason=f"invalid JSON: {reason}", record=raw)
+
+
+def iter_numbered_records(text: str) -> Iterator[Tuple[int, Any]]:
+    """Yield (line, record) for a JSON array or NDJSON document.
+
+    NDJSON lines that are not valid JSON come back as QuarantinedRecord
+    instances instead of aborting the whole document.
+    """
+    pos = _WS_RE.match(text).end()
+    if text.startswith("[", pos):
+        for line, item, _ in iter_array_records(text, pos):
+            yield line, item
+        return
+    for line, raw in enumerate(text.splitlines(), 1):
+        if raw.strip():
+            yield line, parse_ndjson_line(line, raw)
+
+
+def validate_text(text: str) -> ValidationReport:
+    report = ValidationReport()
+    report.ducks.extend(iter_valid_ducks(iter_numbered_records(text), report.quarantine))
+    return report